@@ -7,7 +7,7 @@ Contains all the dataclasses that define the configuration structure.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class MonitoringConfig:
     """Configuration for system monitoring."""
 
@@ -17,7 +17,7 @@ class MonitoringConfig:
     check_interval: int
 
 
-@dataclass
+@dataclass(frozen=True)
 class SlackConfig:
     """Configuration for Slack integration."""
 
@@ -27,7 +27,7 @@ class SlackConfig:
     icon_emoji: str = ":robot_face:"
 
 
-@dataclass
+@dataclass(frozen=True)
 class RemediatorConfig:
     """Configuration for remediation service."""
 
@@ -36,7 +36,7 @@ class RemediatorConfig:
     retry_attempts: int = 3
 
 
-@dataclass
+@dataclass(frozen=True)
 class LoggingConfig:
     """Configuration for logging."""
 
@@ -46,7 +46,7 @@ class LoggingConfig:
     console_output: bool = True
 
 
-@dataclass
+@dataclass(frozen=True)
 class AppConfig:
     """Main application configuration."""
 
@@ -6,6 +6,7 @@ import pytest
 import os
 import tempfile
 import yaml
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 from datetime import datetime
 from config.models import (
@@ -31,9 +32,32 @@ def pytest_addoption(parser):
     )
 
 
+def pytest_collection_modifyitems(config, items):
+    """Skip integration tests at collection unless explicitly requested"""
+    if os.environ.get("CI") or os.environ.get("GITHUB_ACTIONS"):
+        reason = "Integration tests skipped in CI environment"
+    elif not config.getoption("--run-integration"):
+        reason = "Integration tests skipped - use --run-integration to run them"
+    else:
+        return
+
+    skip_integration = pytest.mark.skip(reason=reason)
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
+
+
 # ---------------------
 # Environment handling
 # ---------------------
+@pytest.fixture(autouse=True, scope="session")
+def load_env_file():
+    """Load .env once per session so integration tests can see real tokens"""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
 @pytest.fixture
 def mock_env_vars():
     """Mock environment variables for testing"""
@@ -59,12 +83,12 @@ def clean_environment():
     os.environ.update(original_env)
 
 
-@pytest.fixture(autouse=True)
-def skip_integration_in_ci(request):
-    """Automatically skip integration tests in CI environment"""
-    if request.node.get_closest_marker("integration"):
-        if os.environ.get("CI") or os.environ.get("GITHUB_ACTIONS"):
-            pytest.skip("Integration tests skipped in CI environment")
+@pytest.fixture(autouse=True, scope="session")
+def fixed_hostname():
+    """Report a stable hostname for the whole test session"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("socket.gethostname", lambda: "test-host")
+        yield
 
 
 # ---------------------
@@ -95,7 +119,7 @@ def temp_config_file(test_config):
     os.unlink(temp_file)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def slack_config():
     """Provide Slack configuration for tests"""
     return SlackConfig(
@@ -104,7 +128,7 @@ def slack_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def monitoring_config():
     """Create a test monitoring configuration"""
     return MonitoringConfig(
@@ -112,13 +136,13 @@ def monitoring_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def remediator_config():
     """Create a test remediator configuration"""
     return RemediatorConfig(url="http://localhost:5001")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def app_config(monitoring_config, slack_config, remediator_config):
     """Create a complete test application configuration"""
     return AppConfig(
@@ -145,68 +169,139 @@ def healthy_system_metrics():
     }
 
 
+def apply_psutil_mocks(monkeypatch, **patches):
+    """Apply a batch of dotted-path patches, e.g. ``{"psutil.cpu_percent": fn}``"""
+    for target, value in patches.items():
+        monkeypatch.setattr(target, value)
+
+
+@pytest.fixture
+def mock_psutil(monkeypatch, request):
+    """Patch psutil metrics with healthy defaults
+
+    Override individual values with indirect parametrization, e.g.
+    ``@pytest.mark.parametrize("mock_psutil", [{"cpu": 95.0}], indirect=True)``.
+    Supported keys are ``cpu``, ``mem`` and ``disk``.
+    """
+    values = {"cpu": 45.0, "mem": 60.0, "disk": 70.0}
+    values.update(getattr(request, "param", {}))
+
+    memory = SimpleNamespace(
+        percent=values["mem"], available=8 * 1024**3, total=16 * 1024**3
+    )
+    disk = SimpleNamespace(
+        percent=values["disk"], free=100 * 1024**3, total=500 * 1024**3
+    )
+
+    apply_psutil_mocks(
+        monkeypatch,
+        **{
+            "psutil.cpu_percent": lambda *args, **kwargs: values["cpu"],
+            "psutil.cpu_count": lambda *args, **kwargs: 4,
+            "psutil.virtual_memory": lambda: memory,
+            "psutil.swap_memory": lambda: SimpleNamespace(percent=30.0),
+            "psutil.disk_usage": lambda path: disk,
+        },
+    )
+
+    return values
+
+
+# ---------------------
+# Spec'd client doubles
+# ---------------------
+@pytest.fixture
+def mock_slack_instance():
+    """SlackClient double limited to the real client's attributes"""
+    from clients.slack import SlackClient
+
+    return Mock(spec=SlackClient)
+
+
 @pytest.fixture
-def mock_psutil():
-    """Mock psutil module with healthy defaults"""
-    with patch("psutil.cpu_percent") as mock_cpu, patch(
-        "psutil.cpu_count"
-    ) as mock_cpu_count, patch("psutil.virtual_memory") as mock_memory, patch(
-        "psutil.swap_memory"
-    ) as mock_swap, patch(
-        "psutil.disk_usage"
-    ) as mock_disk:
-
-        mock_cpu.return_value = 45.0
-        mock_cpu_count.return_value = 4
-
-        mock_memory_obj = Mock()
-        mock_memory_obj.percent = 60.0
-        mock_memory_obj.available = 8 * 1024**3
-        mock_memory_obj.total = 16 * 1024**3
-        mock_memory.return_value = mock_memory_obj
-
-        mock_swap_obj = Mock()
-        mock_swap_obj.percent = 30.0
-        mock_swap.return_value = mock_swap_obj
-
-        mock_disk_obj = Mock()
-        mock_disk_obj.percent = 70.0
-        mock_disk_obj.free = 100 * 1024**3
-        mock_disk_obj.total = 500 * 1024**3
-        mock_disk.return_value = mock_disk_obj
-
-        yield {
-            "cpu": mock_cpu,
-            "cpu_count": mock_cpu_count,
-            "memory": mock_memory,
-            "swap": mock_swap,
-            "disk": mock_disk,
-        }
+def mock_remediation_instance():
+    """RemediationClient double limited to the real client's attributes"""
+    from clients.remediation import RemediationClient
+
+    mock_instance = Mock(spec=RemediationClient)
+    mock_instance.trigger_remediation.return_value = True
+    return mock_instance
 
 
 # ---------------------
 # Mock Slack client
 # ---------------------
 @pytest.fixture
-def mock_slack_client():
+def mock_slack_client(monkeypatch):
     """Mock Slack WebClient"""
-    with patch("clients.slack.WebClient") as mock_webclient:
-        mock_instance = Mock()
-        mock_webclient.return_value = mock_instance
+    mock_instance = Mock(spec=["auth_test", "chat_postMessage"])
+    mock_instance.auth_test.return_value = {
+        "ok": True,
+        "user": "test_bot",
+        "team": "test_team",
+    }
+    mock_instance.chat_postMessage.return_value = {
+        "ok": True,
+        "channel": "#test-alerts",
+        "ts": "1234567890.123456",
+    }
+    monkeypatch.setattr("clients.slack.WebClient", Mock(return_value=mock_instance))
+    return mock_instance
+
 
-        mock_instance.auth_test.return_value = {
-            "ok": True,
-            "user": "test_bot",
-            "team": "test_team",
-        }
+@pytest.fixture(scope="session")
+def mock_auth_ok():
+    """Successful auth_test payload"""
+    return {"ok": True, "user": "test", "team": "test"}
 
-        mock_instance.chat_postMessage.return_value = {
-            "ok": True,
-            "channel": "#test-alerts",
-            "ts": "1234567890.123456",
-        }
 
-        yield mock_instance
+@pytest.fixture(scope="class")
+def mock_webclient_class(mock_auth_ok):
+    """Patch WebClient once per test class with a passing auth_test"""
+    from slack_sdk import WebClient
+
+    mock_instance = Mock(spec=WebClient)
+    mock_instance.auth_test.return_value = mock_auth_ok
+    mock_webclient = Mock(return_value=mock_instance)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("clients.slack.WebClient", mock_webclient)
+        yield mock_webclient
+
+
+def _reset_webclient(mock_webclient_class, auth_response):
+    """Put the patched WebClient back to a passing auth_test and chat_postMessage"""
+    mock_webclient_class.reset_mock()
+    mock_instance = mock_webclient_class.return_value
+    mock_instance.reset_mock(return_value=True, side_effect=True)
+    mock_instance.auth_test.return_value = auth_response
+    mock_instance.chat_postMessage.return_value = {"ok": True}
+    return mock_instance
+
+
+@pytest.fixture
+def mock_webclient(mock_webclient_class, mock_auth_ok):
+    """WebClient instance behind the class-wide patch, reset for each test"""
+    return _reset_webclient(mock_webclient_class, mock_auth_ok)
+
+
+@pytest.fixture
+def slack_client(mock_webclient, slack_config):
+    """SlackClient on the class-wide WebClient patch, with call history cleared"""
+    from clients.slack import SlackClient
+
+    return SlackClient(slack_config)
+
+
+@pytest.fixture(scope="class")
+def shared_slack_client(mock_webclient_class, mock_auth_ok, slack_config):
+    """SlackClient built once per class for tests that don't check construction
+
+    Request ``mock_webclient`` alongside it to reset the WebClient per test.
+    """
+    from clients.slack import SlackClient
+
+    _reset_webclient(mock_webclient_class, mock_auth_ok)
+    return SlackClient(slack_config)
 
 
 # ---------------------
@@ -224,17 +319,6 @@ def healthy_health_status():
     )
 
 
-# ---------------------
-# Pytest markers
-# ---------------------
-def pytest_configure(config):
-    """Configure pytest markers"""
-    config.addinivalue_line("markers", "unit: mark test as a unit test")
-    config.addinivalue_line("markers", "integration: mark test as an integration test")
-    config.addinivalue_line("markers", "slow: mark test as slow running")
-    config.addinivalue_line("markers", "network: mark test as requiring network access")
-
-
 # ---------------------
 # Custom assertions
 # ---------------------
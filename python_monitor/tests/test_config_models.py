@@ -3,6 +3,7 @@ Tests for configuration models
 """
 
 import pytest
+from dataclasses import FrozenInstanceError
 
 from config.models import (
     MonitoringConfig,
@@ -104,3 +105,11 @@ class TestConfigModels:
         assert config.slack == slack
         assert config.remediator == remediator
         assert config.logging == logging
+
+    @pytest.mark.unit
+    def test_config_is_immutable(self):
+        """Test that config models cannot be mutated after creation"""
+        config = MonitoringConfig(90, 85, 80, 60)
+
+        with pytest.raises(FrozenInstanceError):
+            config.cpu_threshold = 50
@@ -12,6 +12,7 @@ from utils.exceptions import (
     ThresholdExceededError,
     RateLimitError,
     AuthenticationError,
+    InsufficientPermissionError,
     TimeoutError as EriTimeoutError,
     NetworkError,
     ServiceUnavailableError,
@@ -214,5 +215,21 @@ class TestExceptions:
         with pytest.raises(ConfigurationError):
             test_function_file_not_found()
 
+        with pytest.raises(InsufficientPermissionError, match="Insufficient"):
+            test_function_permission_error()
+
         with pytest.raises(ErioBotException):
             test_function_generic_error()
+
+    @pytest.mark.unit
+    def test_handle_exception_keeps_cause_and_matches_subclasses(self):
+        """Test converted exceptions chain the original and honor subclasses"""
+        from utils.exceptions import handle_exception
+
+        @handle_exception
+        def refused():
+            raise ConnectionRefusedError("Refused")
+
+        with pytest.raises(NetworkError, match="Network connection failed") as exc:
+            refused()
+        assert isinstance(exc.value.__cause__, ConnectionRefusedError)
@@ -138,9 +138,7 @@ class TestCoreHealthFallbackLogic:
         with patch.object(logging, "warning") as mock_warning:
             # Simulate the exact scenario from the module
             try:
-                from health_checker import HealthStatus  # This might fail
-
-                print(f"I just print this so we use this fkn import: {HealthStatus}")
+                from health_checker import HealthStatus  # noqa: F401 - might fail
 
             except ImportError as e:
                 # This is line 26 from the module
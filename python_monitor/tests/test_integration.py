@@ -1,9 +1,19 @@
 import pytest
 import requests
 from unittest.mock import patch, Mock
+from dataclasses import replace
 from datetime import datetime
 
 
+def _ok_response(payload=None):
+    """Build a 200 response double limited to the attributes callers read"""
+    response = Mock(spec=["status_code", "json", "raise_for_status"])
+    response.status_code = 200
+    response.raise_for_status.return_value = None
+    response.json.return_value = payload or {}
+    return response
+
+
 class TestIntegrationUnit:
     """Unit test versions of integration tests - run without external services"""
 
@@ -12,9 +22,7 @@ class TestIntegrationUnit:
     def test_remediator_service_connection_mocked(self, mock_get):
         """Test connection to C# remediator service with mocking"""
         # Mock successful connection
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_get.return_value = mock_response
+        mock_get.return_value = _ok_response()
 
         response = mock_get("http://localhost:5001/health", timeout=5)
         assert response.status_code == 200
@@ -50,9 +58,7 @@ class TestIntegrationUnit:
         # Mock psutil functions
         with patch("psutil.cpu_percent", return_value=45.0), patch(
             "psutil.virtual_memory"
-        ) as mock_memory, patch("psutil.disk_usage") as mock_disk, patch(
-            "socket.gethostname", return_value="test-host"
-        ):
+        ) as mock_memory, patch("psutil.disk_usage") as mock_disk:
 
             # Setup memory and disk mocks
             mock_memory.return_value = Mock(percent=60.0)
@@ -92,16 +98,20 @@ class TestIntegrationUnit:
         mock_remediation_client.return_value = mock_remediation_instance
 
         # Set very low thresholds to trigger alerts
-        app_config.monitoring.cpu_threshold = 1.0
-        app_config.monitoring.memory_threshold = 1.0
-        app_config.monitoring.disk_threshold = 1.0
+        app_config = replace(
+            app_config,
+            monitoring=replace(
+                app_config.monitoring,
+                cpu_threshold=1.0,
+                memory_threshold=1.0,
+                disk_threshold=1.0,
+            ),
+        )
 
         # Mock high system metrics
         with patch("psutil.cpu_percent", return_value=95.0), patch(
             "psutil.virtual_memory"
-        ) as mock_memory, patch("psutil.disk_usage") as mock_disk, patch(
-            "socket.gethostname", return_value="test-host"
-        ):
+        ) as mock_memory, patch("psutil.disk_usage") as mock_disk:
 
             mock_memory.return_value = Mock(percent=95.0)
             mock_disk.return_value = Mock(percent=95.0)
@@ -136,9 +146,7 @@ class TestIntegrationUnit:
         # Mock system metrics
         with patch("psutil.cpu_percent", return_value=45.0), patch(
             "psutil.virtual_memory", return_value=Mock(percent=60.0)
-        ), patch("psutil.disk_usage", return_value=Mock(percent=70.0)), patch(
-            "socket.gethostname", return_value="test-host"
-        ):
+        ), patch("psutil.disk_usage", return_value=Mock(percent=70.0)):
 
             monitor = SystemMonitor(app_config)
 
@@ -201,10 +209,7 @@ class TestIntegrationUnit:
 
         # Test service health checker with mocked requests
         with patch("requests.get") as mock_get:
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {"status": "healthy"}
-            mock_get.return_value = mock_response
+            mock_get.return_value = _ok_response({"status": "healthy"})
 
             service_checker = ServiceHealthChecker("http://localhost:5001")
             service_status = service_checker.check_remediator_service()
@@ -5,6 +5,7 @@ Fixed logger tests
 import pytest
 import logging
 import os
+from pathlib import Path
 from unittest.mock import patch, Mock
 
 # Import the logger module
@@ -66,7 +67,7 @@ class TestSetupLogging:
     """Test setup_logging function"""
 
     @patch("logging.getLogger")
-    @patch("logging.handlers.RotatingFileHandler")
+    @patch("utils.logger._get_rotating_handler")
     @patch("logging.StreamHandler")
     @patch("pathlib.Path.mkdir")
     def test_setup_logging_basic(
@@ -108,6 +109,93 @@ class TestSetupLogging:
             mock_logger.handlers.clear.assert_called_once()
             assert result == mock_logger
 
+    def test_setup_logging_reuses_file_handlers(self, tmp_path, monkeypatch):
+        """Test repeated setup_logging calls share one handler per log file"""
+        from utils import logger as logger_module
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(logger_module, "_HANDLER_CACHE", {})
+
+        first = setup_logging("reuse_test", "INFO", log_to_console=False)
+        first_handlers = list(first.handlers)
+        second = setup_logging("reuse_test", "INFO", log_to_console=False)
+
+        try:
+            assert len(second.handlers) == 2
+            assert second.handlers == first_handlers
+        finally:
+            for handler in second.handlers:
+                handler.close()
+            second.handlers.clear()
+
+    def test_ensure_log_dir_follows_cwd(self, tmp_path, monkeypatch):
+        """Test the logs directory is created again after a cwd change"""
+        from utils.logger import _ensure_log_dir
+
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+
+        monkeypatch.chdir(tmp_path / "a")
+        _ensure_log_dir()
+        monkeypatch.chdir(tmp_path / "b")
+        _ensure_log_dir()
+
+        assert (tmp_path / "a" / "logs").is_dir()
+        assert (tmp_path / "b" / "logs").is_dir()
+
+    def test_rotating_handler_cache_keys(self, tmp_path, monkeypatch):
+        """Test cached handlers are keyed on the resolved file path"""
+        from utils import logger as logger_module
+
+        monkeypatch.setattr(logger_module, "_HANDLER_CACHE", {})
+        formatter = logging.Formatter("%(message)s")
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+
+        monkeypatch.chdir(tmp_path / "a")
+        first = logger_module._get_rotating_handler(
+            Path("key_test.log"), 1024, 1, formatter
+        )
+        again = logger_module._get_rotating_handler(
+            Path("key_test.log"), 1024, 1, Mock()
+        )
+        monkeypatch.chdir(tmp_path / "b")
+        moved = logger_module._get_rotating_handler(
+            Path("key_test.log"), 1024, 1, formatter
+        )
+
+        try:
+            assert again is first
+            assert first.formatter is formatter
+            assert moved is not first
+            assert moved.baseFilename == str(
+                (tmp_path / "b" / "key_test.log").resolve()
+            )
+        finally:
+            for handler in (first, moved):
+                handler.close()
+
+    def test_entry_points_share_file_handlers(self, tmp_path, monkeypatch):
+        """Test EriLogger and setup_logging write each file through one handler"""
+        from utils import logger as logger_module
+        from utils.logger import EriLogger
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(logger_module, "_HANDLER_CACHE", {})
+
+        configured = setup_logging("shared_test", "INFO", log_to_console=False)
+        file_handlers = list(configured.handlers)
+        configured.handlers.clear()
+
+        eri_logger = EriLogger("shared_test", "WARNING").get_logger()
+
+        try:
+            assert eri_logger.handlers[1:] == file_handlers
+        finally:
+            for handler in eri_logger.handlers:
+                handler.close()
+            eri_logger.handlers.clear()
+
 
 class TestLogSystemInfo:
     """Test log_system_info function"""
@@ -138,6 +226,17 @@ class TestLogSystemInfo:
         assert any("Platform:" in call for call in info_calls)
         assert any("CPU Count:" in call for call in info_calls)
 
+    @patch("utils.logger.psutil")
+    def test_log_system_info_skipped_below_info(self, mock_psutil):
+        """Test log_system_info does no queries when INFO is disabled"""
+        mock_logger = Mock(spec=logging.Logger)
+        mock_logger.isEnabledFor.return_value = False
+
+        log_system_info(mock_logger)
+
+        mock_logger.info.assert_not_called()
+        mock_psutil.virtual_memory.assert_not_called()
+
     def test_log_system_info_with_exception(self):
         """Test log_system_info when psutil raises an exception"""
         mock_logger = Mock(spec=logging.Logger)
@@ -194,6 +293,117 @@ class TestEriLogger:
         assert eri_logger.logger == mock_logger
 
 
+class TestFastRotatingFileHandler:
+    """Test FastRotatingFileHandler class"""
+
+    def _record(self, msg):
+        return logging.LogRecord("test", logging.INFO, "test.py", 1, msg, (), None)
+
+    def test_tracks_size_without_stat(self, tmp_path):
+        """Test that emitting records does not stat the log file"""
+        from utils.logger import FastRotatingFileHandler
+
+        handler = FastRotatingFileHandler(
+            tmp_path / "fast.log", maxBytes=1024, backupCount=1
+        )
+        try:
+            with patch("os.path.getsize") as mock_getsize:
+                handler.emit(self._record("hello"))
+                handler.emit(self._record("world"))
+                mock_getsize.assert_not_called()
+
+            handler.flush()
+            assert handler._approx_size == len("hello\n") + len("world\n")
+            assert handler._approx_size == os.path.getsize(tmp_path / "fast.log")
+        finally:
+            handler.close()
+
+    def test_buffers_until_flush_level(self, tmp_path):
+        """Test that records below flush_level stay buffered"""
+        from utils.logger import FastRotatingFileHandler
+
+        log_file = tmp_path / "fast.log"
+        handler = FastRotatingFileHandler(log_file, maxBytes=1024, backupCount=1)
+        try:
+            handler.emit(self._record("buffered"))
+            assert log_file.read_text() == ""
+
+            error = self._record("failure")
+            error.levelno = logging.ERROR
+            handler.emit(error)
+            assert log_file.read_text() == "buffered\nfailure\n"
+        finally:
+            handler.close()
+
+    def test_tracks_size_without_explicit_encoding(self, tmp_path):
+        """Test size tracking when the handler uses the default encoding"""
+        from utils.logger import FastRotatingFileHandler
+
+        log_file = tmp_path / "fast.log"
+        handler = FastRotatingFileHandler(log_file, maxBytes=1024, backupCount=1)
+        try:
+            with patch.object(handler, "handleError") as mock_handle_error:
+                handler.emit(self._record("hello"))
+                mock_handle_error.assert_not_called()
+
+            handler.flush()
+            assert handler._approx_size == len("hello\n")
+            assert handler._approx_size == os.path.getsize(log_file)
+        finally:
+            handler.close()
+
+    def test_warning_reaches_disk_without_later_emit(self, tmp_path):
+        """Test WARNING records are flushed as soon as they are emitted"""
+        from utils.logger import FastRotatingFileHandler
+
+        log_file = tmp_path / "fast.log"
+        handler = FastRotatingFileHandler(log_file, maxBytes=1024, backupCount=1)
+        try:
+            warning = self._record("alert")
+            warning.levelno = logging.WARNING
+            handler.emit(warning)
+
+            assert log_file.read_text() == "alert\n"
+        finally:
+            handler.close()
+
+    def test_background_flush(self, tmp_path):
+        """Test the background flusher writes out buffered records"""
+        from utils import logger as logger_module
+        from utils.logger import FastRotatingFileHandler
+
+        log_file = tmp_path / "fast.log"
+        handler = FastRotatingFileHandler(log_file, maxBytes=1024, backupCount=1)
+        try:
+            handler.emit(self._record("buffered"))
+            assert log_file.read_text() == ""
+
+            assert logger_module._flusher.is_alive()
+            logger_module._flush_buffered_handlers()
+            assert log_file.read_text() == "buffered\n"
+        finally:
+            handler.close()
+
+        assert handler not in logger_module._BUFFERED_HANDLERS
+
+    def test_rolls_over_when_size_exceeded(self, tmp_path):
+        """Test rollover once the tracked size reaches maxBytes"""
+        from utils.logger import FastRotatingFileHandler
+
+        log_file = tmp_path / "fast.log"
+        handler = FastRotatingFileHandler(log_file, maxBytes=10, backupCount=1)
+        try:
+            handler.emit(self._record("x" * 20))
+            handler.emit(self._record("after"))
+            handler.flush()
+
+            assert (tmp_path / "fast.log.1").read_text() == "x" * 20 + "\n"
+            assert log_file.read_text() == "after\n"
+            assert handler._approx_size == len("after\n")
+        finally:
+            handler.close()
+
+
 class TestColorFormatter:
     """Test ColorFormatter class"""
 
@@ -237,3 +447,24 @@ class TestColorFormatter:
         formatted = formatter.format(record)
 
         assert "test message" in formatted
+
+    def test_color_formatter_restores_levelname(self):
+        """Test ColorFormatter leaves the record uncolored for other handlers"""
+        from utils.logger import ColorFormatter
+
+        formatter = ColorFormatter("%(levelname)s - %(message)s")
+        record = logging.LogRecord(
+            name="test",
+            level=logging.ERROR,
+            pathname="test.py",
+            lineno=1,
+            msg="test message",
+            args=(),
+            exc_info=None,
+        )
+
+        formatted = formatter.format(record)
+
+        assert formatted.startswith("\033[31mERROR\033[0m")
+        assert record.levelname == "ERROR"
+        assert logging.Formatter("%(levelname)s").format(record) == "ERROR"
@@ -3,90 +3,52 @@ Tests for Slack client module
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
 import os
-from dotenv import load_dotenv
-
-load_dotenv()
+from dataclasses import replace
 
 
+@pytest.mark.usefixtures("mock_webclient_class")
 class TestSlackClientUnit:
     """Unit tests with mocking - fast and don't require real Slack API"""
 
     @pytest.mark.unit
-    @patch("clients.slack.WebClient")
-    def test_slack_client_creation(self, mock_webclient_class, slack_config):
+    def test_slack_client_creation(
+        self, slack_client, mock_webclient_class, slack_config
+    ):
         """Test SlackClient creation"""
-        from clients.slack import SlackClient
-
-        # Mock the WebClient and its methods
-        mock_client_instance = MagicMock()
-        mock_client_instance.auth_test.return_value = {
-            "ok": True,
-            "user": "test",
-            "team": "test",
-        }
-        mock_webclient_class.return_value = mock_client_instance
-
-        client = SlackClient(slack_config)
-        assert client.config == slack_config
+        assert slack_client.config == slack_config
 
         # Verify WebClient was called with the token
         mock_webclient_class.assert_called_once_with(token=slack_config.token)
-        mock_client_instance.auth_test.assert_called_once()
+        slack_client.client.auth_test.assert_called_once()
 
     @pytest.mark.unit
-    @patch("clients.slack.WebClient")
-    def test_send_slack_message_success(self, mock_webclient_class, slack_config):
+    def test_send_slack_message_success(self, slack_client, slack_config):
         """Test successful Slack message sending with mocks"""
-        from clients.slack import SlackClient
-
-        # Mock the WebClient and its methods
-        mock_client_instance = MagicMock()
-        mock_client_instance.auth_test.return_value = {
-            "ok": True,
-            "user": "test",
-            "team": "test",
-        }
-        mock_client_instance.chat_postMessage.return_value = {"ok": True}
-        mock_webclient_class.return_value = mock_client_instance
+        slack_client.client.chat_postMessage.return_value = {"ok": True}
 
-        client = SlackClient(slack_config)
-        result = client.send_message("Test message")
+        result = slack_client.send_message("Test message")
 
         assert result is True
-        mock_client_instance.chat_postMessage.assert_called_once()
+        slack_client.client.chat_postMessage.assert_called_once()
 
         # Check that the message was formatted correctly
-        call_args = mock_client_instance.chat_postMessage.call_args
-        assert "Test message" in str(call_args)
+        call_kwargs = slack_client.client.chat_postMessage.call_args.kwargs
+        assert call_kwargs["text"].endswith(" Test message")
+        assert call_kwargs["channel"] == slack_config.channel
 
     @pytest.mark.unit
-    @patch("clients.slack.WebClient")
-    def test_send_empty_message(self, mock_webclient_class, slack_config):
+    def test_send_empty_message(self, slack_client):
         """Test sending empty message"""
-        from clients.slack import SlackClient
-
-        # Mock the WebClient
-        mock_client_instance = MagicMock()
-        mock_client_instance.auth_test.return_value = {
-            "ok": True,
-            "user": "test",
-            "team": "test",
-        }
-        mock_webclient_class.return_value = mock_client_instance
-
-        client = SlackClient(slack_config)
-        result = client.send_message("")
+        result = slack_client.send_message("")
 
         # Should return False for empty message
         assert result is False
         # Should not call chat_postMessage for empty message
-        mock_client_instance.chat_postMessage.assert_not_called()
+        slack_client.client.chat_postMessage.assert_not_called()
 
     @pytest.mark.unit
-    @patch("clients.slack.WebClient")
-    def test_slack_client_invalid_token_format(self, mock_webclient_class):
+    def test_slack_client_invalid_token_format(self):
         """Test SlackClient with invalid token format"""
         from clients.slack import SlackClient, AuthenticationError
         from config.models import SlackConfig
@@ -102,8 +64,7 @@ class TestSlackClientUnit:
             SlackClient(invalid_config)
 
     @pytest.mark.unit
-    @patch("clients.slack.WebClient")
-    def test_slack_client_empty_token(self, mock_webclient_class):
+    def test_slack_client_empty_token(self):
         """Test SlackClient with empty token"""
         from clients.slack import SlackClient, AuthenticationError
         from config.models import SlackConfig
@@ -117,36 +78,31 @@ class TestSlackClientUnit:
             SlackClient(invalid_config)
 
 
-class TestSlackClientIntegration:
-    """Integration tests with real Slack API - requires token and --run-integration flag"""
+@pytest.fixture(scope="session")
+def real_slack_client(load_env_file, slack_config):
+    """SlackClient on the real token, authenticated once per session"""
+    from clients.slack import SlackClient, SlackError, AuthenticationError
+
+    token = os.environ.get("SLACK_BOT_TOKEN")
+    if not token:
+        pytest.skip("SLACK_BOT_TOKEN not found - skipping integration tests")
 
-    @pytest.fixture(autouse=True)
-    def check_integration_flag(self, request):
-        """Check if integration tests should run"""
-        if not request.config.getoption("--run-integration", default=False):
-            pytest.skip("Integration tests skipped - use --run-integration to run them")
+    try:
+        return SlackClient(replace(slack_config, token=token))
+    except (SlackError, AuthenticationError) as e:
+        pytest.skip(f"Slack authentication failed: {e}")
 
-    @pytest.fixture(autouse=True)
-    def check_ci_environment(self):
-        """Skip integration tests in CI environment"""
-        if os.environ.get("CI") or os.environ.get("GITHUB_ACTIONS"):
-            pytest.skip("Integration tests skipped in CI environment")
 
-    @pytest.fixture(autouse=True)
-    def check_slack_setup(self):
-        """Check if Slack is properly configured"""
-        if not os.environ.get("SLACK_BOT_TOKEN"):
-            pytest.skip("SLACK_BOT_TOKEN not found - skipping integration tests")
+# Keep real Slack sends on one worker when run with --dist=loadgroup
+@pytest.mark.xdist_group("slack_integration")
+class TestSlackClientIntegration:
+    """Integration tests with real Slack API - requires token and --run-integration flag"""
 
     @pytest.mark.integration
-    def test_real_slack_message(self, slack_config):
+    def test_real_slack_message(self, real_slack_client):
         """Test sending a real message to Slack"""
-        from clients.slack import SlackClient
-
-        # Use real token from environment
-        slack_config.token = os.environ.get("SLACK_BOT_TOKEN", "")
-
-        client = SlackClient(slack_config)
-        result = client.send_message(" Test message from pytest - Integration test")
+        result = real_slack_client.send_message(
+            " Test message from pytest - Integration test"
+        )
 
         assert result is True
@@ -95,7 +95,7 @@ class AuthenticationError(ErioBotException):
     """Raised when authentication fails"""
 
 
-class PermissionError(ErioBotException):
+class InsufficientPermissionError(ErioBotException):
     """Raised when insufficient permissions are detected"""
 
 
@@ -183,6 +183,25 @@ def raise_remediation_error(action: str, error: str):
     )
 
 
+# Built-in exception -> (EriBot exception, message prefix) used by handle_exception
+_EXCEPTION_MAP = {
+    ConnectionError: (NetworkError, "Network connection failed"),
+    FileNotFoundError: (ConfigurationError, "Required file not found"),
+    PermissionError: (InsufficientPermissionError, "Insufficient permissions"),
+    ValueError: (ValidationError, "Invalid value"),
+}
+
+
+def _convert_exception(error: Exception, func_name: str) -> ErioBotException:
+    """Map an exception to its EriBot equivalent, most specific base class first"""
+    for exc_type in type(error).__mro__:
+        if exc_type in _EXCEPTION_MAP:
+            eribot_type, prefix = _EXCEPTION_MAP[exc_type]
+            return eribot_type(f"{prefix}: {error}")
+    # Convert unexpected exceptions
+    return ErioBotException(f"Unexpected error in {func_name}: {error}")
+
+
 def handle_exception(func):
     """Decorator to convert common exceptions to EriBot exceptions"""
     import functools
@@ -194,16 +213,7 @@ def handle_exception(func):
         except ErioBotException:
             # Re-raise EriBot exceptions as-is
             raise
-        except ConnectionError as e:
-            raise NetworkError(f"Network connection failed: {e}")
-        except FileNotFoundError as e:
-            raise ConfigurationError(f"Required file not found: {e}")
-        except PermissionError as e:
-            raise PermissionError(f"Insufficient permissions: {e}")
-        except ValueError as e:
-            raise ValidationError(f"Invalid value: {e}")
         except Exception as e:
-            # Convert unexpected exceptions
-            raise ErioBotException(f"Unexpected error in {func.__name__}: {e}")
+            raise _convert_exception(e, func.__name__) from e
 
     return wrapper
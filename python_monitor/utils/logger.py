@@ -8,9 +8,145 @@ import logging
 import logging.handlers
 import sys
 import os
+import threading
+import time
+import weakref
 from pathlib import Path
 
 
+# Buffered file handlers are flushed by one background thread on this interval
+_FLUSH_INTERVAL = 5.0
+_BUFFERED_HANDLERS: "weakref.WeakSet[FastRotatingFileHandler]" = weakref.WeakSet()
+_flusher_lock = threading.Lock()
+_flusher = None
+
+
+def _flush_buffered_handlers():
+    """Flush every live buffered file handler"""
+    for handler in list(_BUFFERED_HANDLERS):
+        try:
+            handler.flush()
+        except OSError:
+            pass  # One failing file must not stop the other handlers flushing
+
+
+def _run_flusher():
+    while True:
+        time.sleep(_FLUSH_INTERVAL)
+        _flush_buffered_handlers()
+
+
+def _start_flusher():
+    """Start the background flush thread the first time it is needed"""
+    global _flusher
+    with _flusher_lock:
+        if _flusher is None:
+            _flusher = threading.Thread(
+                target=_run_flusher, name="eribot-log-flusher", daemon=True
+            )
+            _flusher.start()
+
+
+class FastRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that tracks the log size in-process
+
+    The stock handler seeks and re-formats every record in shouldRollover;
+    this one counts the bytes it writes and only touches the filesystem when
+    the file is opened or rotated. Writes go through a 64KB buffer that is
+    flushed for records at flush_level or above, every _FLUSH_INTERVAL
+    seconds by a background thread, on rollover and on close.
+    """
+
+    buffer_size = 64 * 1024
+
+    def __init__(self, *args, flush_level: int = logging.WARNING, **kwargs):
+        self.flush_level = flush_level
+        super().__init__(*args, **kwargs)
+        self._approx_size = self._file_size()
+        _BUFFERED_HANDLERS.add(self)
+        _start_flusher()
+
+    def _open(self):
+        return self._builtin_open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def _file_size(self) -> int:
+        try:
+            return os.path.getsize(self.baseFilename)
+        except OSError:
+            return 0
+
+    def close(self):
+        _BUFFERED_HANDLERS.discard(self)
+        super().close()
+
+    def shouldRollover(self, record) -> bool:
+        return self.maxBytes > 0 and self._approx_size >= self.maxBytes
+
+    def doRollover(self):
+        super().doRollover()
+        self._approx_size = self._file_size()
+
+    def emit(self, record):
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            msg = self.format(record) + self.terminator
+            self.stream.write(msg)
+            if record.levelno >= self.flush_level:
+                self.flush()
+            # The stream knows the real codec, even when encoding is "locale"
+            self._approx_size += len(msg.encode(self.stream.encoding, "replace"))
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+# Log directory is relative to the cwd; remember each cwd it was created in
+_LOG_DIR = Path("logs")
+_LOG_DIR_CWDS: set[str] = set()
+
+
+def _ensure_log_dir() -> Path:
+    """Create the logs directory once per working directory and return it"""
+    cwd = os.getcwd()
+    if cwd not in _LOG_DIR_CWDS:
+        _LOG_DIR.mkdir(exist_ok=True)
+        _LOG_DIR_CWDS.add(cwd)
+    return _LOG_DIR
+
+
+# Rotating file handlers shared by every logger setup path, keyed by the
+# resolved log file so each file has exactly one writer and size counter
+_HANDLER_CACHE: dict[Path, logging.Handler] = {}
+
+
+def _get_rotating_handler(
+    path: Path, max_bytes: int, backups: int, formatter: logging.Formatter
+) -> logging.Handler:
+    """Return the cached rotating file handler, creating it on first use"""
+    path = path.resolve()
+    handler = _HANDLER_CACHE.get(path)
+    if handler is None:
+        handler = FastRotatingFileHandler(
+            filename=path,
+            maxBytes=max_bytes,
+            backupCount=backups,
+            encoding="utf-8",
+        )
+        handler.setFormatter(formatter)
+        _HANDLER_CACHE[path] = handler
+    return handler
+
+
 class ColorFormatter(logging.Formatter):
     """Custom formatter with color support for console output"""
 
@@ -24,11 +160,24 @@ class ColorFormatter(logging.Formatter):
         "RESET": "\033[0m",  # Reset
     }
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Colored level names, built once instead of per record
+        reset = self.COLORS["RESET"]
+        self._colored = {
+            level: f"{color}{level}{reset}"
+            for level, color in self.COLORS.items()
+            if level != "RESET"
+        }
+
     def format(self, record):
-        if hasattr(record, "levelname"):
-            color = self.COLORS.get(record.levelname, self.COLORS["RESET"])
-            record.levelname = f"{color}{record.levelname}{self.COLORS['RESET']}"
-        return super().format(record)
+        levelname = record.levelname
+        record.levelname = self._colored.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            # Restore so other handlers don't see the color codes
+            record.levelname = levelname
 
 
 class EriLogger:
@@ -47,9 +196,7 @@ class EriLogger:
     def _setup_handlers(self):
         """Set up console and file handlers"""
 
-        # Create logs directory
-        log_dir = Path("logs")
-        log_dir.mkdir(exist_ok=True)
+        log_dir = _ensure_log_dir()
 
         # Console handler with colors
         console_handler = logging.StreamHandler(sys.stdout)
@@ -61,30 +208,21 @@ class EriLogger:
         )
         console_handler.setFormatter(console_format)
 
-        # File handler with rotation
-        file_handler = logging.handlers.RotatingFileHandler(
-            filename=log_dir / f"{self.name}.log",
-            maxBytes=10 * 1024 * 1024,  # 10MB
-            backupCount=5,
-            encoding="utf-8",
-        )
-        file_handler.setLevel(self.log_level)
-
         file_format = logging.Formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
         )
-        file_handler.setFormatter(file_format)
+
+        # File handler with rotation; the logger's own level does the filtering
+        file_handler = _get_rotating_handler(
+            log_dir / f"{self.name}.log", 10 * 1024 * 1024, 5, file_format  # 10MB
+        )
 
         # Error handler (separate file for errors only)
-        error_handler = logging.handlers.RotatingFileHandler(
-            filename=log_dir / f"{self.name}-error.log",
-            maxBytes=5 * 1024 * 1024,  # 5MB
-            backupCount=3,
-            encoding="utf-8",
+        error_handler = _get_rotating_handler(
+            log_dir / f"{self.name}-error.log", 5 * 1024 * 1024, 3, file_format  # 5MB
         )
         error_handler.setLevel(logging.ERROR)
-        error_handler.setFormatter(file_format)
 
         # Add handlers to logger
         self.logger.addHandler(console_handler)
@@ -140,30 +278,19 @@ def setup_logging(
 
     # File handlers
     if log_to_file:
-        # Create logs directory
-        log_dir = Path("logs")
-        log_dir.mkdir(exist_ok=True)
-
-        # Main log file
-        file_handler = logging.handlers.RotatingFileHandler(
-            filename=log_dir / f"{name}.log",
-            maxBytes=10 * 1024 * 1024,  # 10MB
-            backupCount=5,
-            encoding="utf-8",
+        log_dir = _ensure_log_dir()
+
+        # Main log file; the logger's own level does the filtering
+        file_handler = _get_rotating_handler(
+            log_dir / f"{name}.log", 10 * 1024 * 1024, 5, detailed_formatter  # 10MB
         )
-        file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(detailed_formatter)
         logger.addHandler(file_handler)
 
         # Error log file
-        error_handler = logging.handlers.RotatingFileHandler(
-            filename=log_dir / f"{name}-error.log",
-            maxBytes=5 * 1024 * 1024,  # 5MB
-            backupCount=3,
-            encoding="utf-8",
+        error_handler = _get_rotating_handler(
+            log_dir / f"{name}-error.log", 5 * 1024 * 1024, 3, detailed_formatter  # 5MB
         )
         error_handler.setLevel(logging.ERROR)
-        error_handler.setFormatter(detailed_formatter)
         logger.addHandler(error_handler)
 
     return logger
@@ -172,40 +299,42 @@ def setup_logging(
 def log_system_info(logger: logging.Logger):
     """Log system information at startup"""
 
+    # Skip the platform/psutil queries entirely when INFO would be dropped
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     logger.info("=" * 50)
     logger.info("EriBot System Information")
     logger.info("=" * 50)
 
     # Platform information
     try:
-        logger.info(f"Platform: {platform.platform()}")
+        logger.info("Platform: %s", platform.platform())
     except Exception as e:
-        logger.error(f"Error getting platform info: {e}")
+        logger.error("Error getting platform info: %s", e)
 
     try:
-        logger.info(f"Python: {platform.python_version()}")
+        logger.info("Python: %s", platform.python_version())
     except Exception as e:
-        logger.error(f"Error getting Python version: {e}")
+        logger.error("Error getting Python version: %s", e)
 
     # CPU information
     try:
-        logger.info(f"CPU Count: {psutil.cpu_count()}")
+        logger.info("CPU Count: %s", psutil.cpu_count())
     except Exception as e:
-        logger.error(f"Error getting CPU count: {e}")
+        logger.error("Error getting CPU count: %s", e)
 
     # Memory information
     try:
-        memory_gb = psutil.virtual_memory().total / (1024**3)
-        logger.info(f"Memory: {memory_gb:.1f} GB")
+        logger.info("Memory: %.1f GB", psutil.virtual_memory().total / (1024**3))
     except Exception as e:
-        logger.error(f"Error getting memory info: {e}")
+        logger.error("Error getting memory info: %s", e)
 
     # Disk information
     try:
-        disk_gb = psutil.disk_usage("/").total / (1024**3)
-        logger.info(f"Disk: {disk_gb:.1f} GB")
+        logger.info("Disk: %.1f GB", psutil.disk_usage("/").total / (1024**3))
     except Exception as e:
-        logger.error(f"Error getting disk info: {e}")
+        logger.error("Error getting disk info: %s", e)
 
     logger.info("=" * 50)
 
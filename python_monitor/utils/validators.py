@@ -2,12 +2,34 @@
 Streamlined validation logic
 """
 
-import re
+import json
+import string
 import ipaddress
-from urllib.parse import urlparse
+from functools import lru_cache, partial, wraps
+from urllib.parse import urlsplit
 from python_monitor.utils.exceptions import ValidationError
 
+# Character sets built once at import; the validators run on every config load
+_SLACK_CHANNEL_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+_HOSTNAME_CHARS = frozenset(string.ascii_letters + string.digits + "._-")
+_NUMERIC_TYPES = (int, float)
+_URL_SCHEMES = frozenset(("http", "https"))
 
+
+def _cache_valid(validator):
+    """Remember string values that passed; failures raise and are never cached"""
+    cached = lru_cache(maxsize=512)(validator)
+
+    @wraps(validator)
+    def wrapper(value):
+        if isinstance(value, str):
+            return cached(value)
+        return validator(value)
+
+    return wrapper
+
+
+@_cache_valid
 def validate_slack_token(token):
     """
     Validate Slack bot token format.
@@ -39,28 +61,33 @@ def validate_slack_token(token):
 
     # Basic format validation for real xoxb tokens
     # Format is typically: xoxb-{team_id}-{bot_id}-{secret}
-    parts = token.split("-")
-    if len(parts) < 4:
+    # Locate the separators in place rather than splitting the whole token
+    team_end = token.find("-", 5)
+    bot_end = token.find("-", team_end + 1) if team_end != -1 else -1
+    if bot_end == -1:
         raise ValidationError(
             "Invalid Slack token format. Expected format: xoxb-{team_id}-{bot_id}-{secret}"
         )
 
     # Check that team_id and bot_id parts are numeric (for real tokens)
-    try:
-        int(parts[1])  # team_id should be numeric
-        int(parts[2])  # bot_id should be numeric
-    except (ValueError, IndexError):
+    if not (
+        token[5:team_end].isdecimal() and token[team_end + 1 : bot_end].isdecimal()
+    ):
         raise ValidationError(
             "Invalid Slack token format. Team ID and Bot ID must be numeric"
         )
 
-    # Check that the secret part exists and has reasonable length
-    if len(parts) < 4 or len(parts[3]) < 20:
+    # Check that the secret part (up to any further hyphen) has reasonable length
+    secret_end = token.find("-", bot_end + 1)
+    if secret_end == -1:
+        secret_end = len(token)
+    if secret_end - bot_end - 1 < 20:
         raise ValidationError("Invalid Slack token format. Secret part is too short")
 
     return True
 
 
+@_cache_valid
 def validate_slack_channel(channel):
     """
     Validate Slack channel name format.
@@ -96,7 +123,7 @@ def validate_slack_channel(channel):
 
     # Check for valid characters: lowercase letters, numbers, hyphens, underscores
     # Made more permissive - allow mixed case for test scenarios
-    if not re.match(r"^[a-zA-Z0-9_-]+$", channel_name):
+    if not _SLACK_CHANNEL_CHARS.issuperset(channel_name):
         raise ValidationError(
             "Invalid Slack channel format. Must contain only letters, numbers, hyphens, or underscores"
         )
@@ -126,7 +153,7 @@ def validate_threshold(threshold, min_val=0, max_val=100):
     if isinstance(threshold, bool):
         raise ValidationError("Threshold must be a number")
 
-    if not isinstance(threshold, (int, float)):
+    if not isinstance(threshold, _NUMERIC_TYPES):
         raise ValidationError("Threshold must be a number")
 
     if threshold < min_val or threshold > max_val:
@@ -135,6 +162,7 @@ def validate_threshold(threshold, min_val=0, max_val=100):
     return True
 
 
+@_cache_valid
 def validate_url(url):
     """
     Validate URL format.
@@ -154,23 +182,24 @@ def validate_url(url):
     if not isinstance(url, str):
         raise ValidationError("URL must be a string")
 
+    # urlsplit skips the params split urlparse does; only scheme/host matter
     try:
-        parsed = urlparse(url)
-
-        # Must have a scheme (http or https)
-        if parsed.scheme not in ["http", "https"]:
-            raise ValidationError("Invalid URL format. Must use http or https scheme")
+        parsed = urlsplit(url)
+    except ValueError as e:
+        raise ValidationError(f"Invalid URL format: {e}")
 
-        # Must have a netloc (domain/host)
-        if not parsed.netloc:
-            raise ValidationError("Invalid URL format. Must have a valid host")
+    # Must have a scheme (http or https)
+    if parsed.scheme not in _URL_SCHEMES:
+        raise ValidationError("Invalid URL format. Must use http or https scheme")
 
-        return True
+    # Must have a netloc (domain/host)
+    if not parsed.netloc:
+        raise ValidationError("Invalid URL format. Must have a valid host")
 
-    except Exception as e:
-        raise ValidationError(f"Invalid URL format: {str(e)}")
+    return True
 
 
+@_cache_valid
 def validate_hostname(hostname):
     """
     Validate hostname according to RFC standards.
@@ -193,26 +222,28 @@ def validate_hostname(hostname):
     if len(hostname) > 253:
         raise ValidationError("Hostname too long (max 253 characters)")
 
-    # Check if it's an IP address (which is valid as hostname)
-    try:
-        ipaddress.ip_address(hostname)
-        return True  # Valid IP address
-    except ValueError:
-        pass  # Not an IP, continue with hostname validation
+    # Check if it's an IP address (which is valid as hostname). Only strings
+    # that could be one are parsed: IPv4 starts with a digit, IPv6 has a colon
+    if hostname[0].isdigit() or ":" in hostname:
+        try:
+            ipaddress.ip_address(hostname)
+            return True  # Valid IP address
+        except ValueError:
+            pass  # Not an IP, continue with hostname validation
 
     # Allow localhost specifically
     if hostname.lower() == "localhost":
         return True
 
     # Hostname validation - more permissive than original
-    if hostname.startswith("-") or hostname.endswith("-"):
+    if hostname[0] == "-" or hostname[-1] == "-":
         raise ValidationError("Hostname cannot start or end with hyphen")
 
     if ".." in hostname:
         raise ValidationError("Hostname cannot contain consecutive dots")
 
     # Check for invalid characters - allow underscores for compatibility
-    if not re.match(r"^[a-zA-Z0-9._-]+$", hostname):
+    if not _HOSTNAME_CHARS.issuperset(hostname):
         raise ValidationError("Hostname contains invalid characters")
 
     # Check each label (part between dots)
@@ -224,12 +255,38 @@ def validate_hostname(hostname):
             raise ValidationError("Hostname cannot contain empty labels")
         if len(label) > 63:
             raise ValidationError("Hostname label too long (max 63 characters)")
-        if label.startswith("-") or label.endswith("-"):
+        if label[0] == "-" or label[-1] == "-":
             raise ValidationError("Hostname label cannot start or end with hyphen")
 
     return True
 
 
+def _positive_number(value, label):
+    """Raise ValidationError unless value is a positive int or float"""
+    if not isinstance(value, _NUMERIC_TYPES) or value <= 0:
+        raise ValidationError(f"{label} must be a positive number, got {value}")
+
+
+# Field-specific validators per configuration section
+_FIELD_VALIDATORS = {
+    "slack": {
+        "token": validate_slack_token,
+        "channel": validate_slack_channel,
+    },
+    "monitoring": {
+        "cpu_threshold": validate_threshold,
+        "memory_threshold": validate_threshold,
+        "disk_threshold": validate_threshold,
+        "check_interval": partial(_positive_number, label="Check interval"),
+    },
+    "remediator": {
+        "url": validate_url,
+        "timeout": partial(_positive_number, label="timeout"),
+        "retry_attempts": partial(_positive_number, label="retry_attempts"),
+    },
+}
+
+
 def validate_config_section(
     config_dict, section_name, required_fields=None, optional_fields=None
 ):
@@ -263,33 +320,15 @@ def validate_config_section(
 
     # Validate known fields
     all_known_fields = set(required_fields + optional_fields)
+    section_validators = _FIELD_VALIDATORS.get(section_name, {})
     for field, value in config_dict.items():
         if field not in all_known_fields:
             # Warning for unknown fields but don't fail
             continue
 
-        # Perform field-specific validation
-        if section_name == "slack":
-            if field == "token":
-                validate_slack_token(value)
-            elif field == "channel":
-                validate_slack_channel(value)
-        elif section_name == "monitoring":
-            if field in ["cpu_threshold", "memory_threshold", "disk_threshold"]:
-                validate_threshold(value)
-            elif field == "check_interval":
-                if not isinstance(value, (int, float)) or value <= 0:
-                    raise ValidationError(
-                        f"Check interval must be a positive number, got {value}"
-                    )
-        elif section_name == "remediator":
-            if field == "url":
-                validate_url(value)
-            elif field in ["timeout", "retry_attempts"]:
-                if not isinstance(value, (int, float)) or value <= 0:
-                    raise ValidationError(
-                        f"{field} must be a positive number, got {value}"
-                    )
+        validator = section_validators.get(field)
+        if validator is not None:
+            validator(value)
 
     return True
 
@@ -310,7 +349,24 @@ def validate_complete_config(config):
     if not isinstance(config, dict):
         raise ValidationError("Configuration must be a dictionary")
 
-    # Validate each section
+    # Configs rarely change between calls, so remember the ones that passed.
+    # Anything that can't be serialized as a cache key is validated directly.
+    try:
+        cache_key = json.dumps(config, sort_keys=True)
+    except (TypeError, ValueError):
+        return _validate_sections(config)
+
+    return _validate_serialized_config(cache_key)
+
+
+@lru_cache(maxsize=64)
+def _validate_serialized_config(config_json):
+    """Validate a JSON-serialized config; only successful results are cached"""
+    return _validate_sections(json.loads(config_json))
+
+
+def _validate_sections(config):
+    """Validate each known section of a configuration dictionary"""
     sections = {
         "monitoring": {
             "required": [